@@ -162,7 +162,7 @@ class BuildLog:
         with self.__lock:
             operation = Operation(module.fullname, self.outpath, module._filepath,
                                   filename_in, filename_out, time, metadata)
-            LOGGER.debug(str(operation))
+            LOGGER.debug("%s", operation)
 
             previous = self._build_files.get(filename_out, None)
             if previous is not None:
@@ -16,6 +16,8 @@ import lbuild.utils
 
 
 class CollectorContext:
+    __slots__ = ("module", "filename")
+
     def __init__(self, module, filename=None):
         self.module = module
         self.filename = filename
@@ -57,9 +59,7 @@ class Collector(BaseNode):
             self._extend_values(CollectorContext(module), checked_values)
 
     def _extend_values(self, context, values):
-        if context not in self._values:
-            self._values[context] = []
-        self._values[context].extend(values)
+        self._values.setdefault(context, []).extend(values)
 
     def values(self, default=None, filterfunc=None, unique=True):
         if filterfunc is None:
@@ -27,6 +27,26 @@ from .exception import LbuildConfigException, LbuildConfigNotFoundException, \
 LOGGER = logging.getLogger('lbuild.config')
 DEFAULT_CACHE_FOLDER = ".lbuild_cache"
 
+# Precompiled queries for the configuration file
+_XPATH_MODULES = lxml.etree.XPath('modules/module/text()')
+_XPATH_OPTIONS = lxml.etree.XPath('options/option')
+_XPATH_COLLECTORS = lxml.etree.XPath('collectors/collect')
+
+_SCHEMA = None
+
+
+def _get_schema():
+    """
+    Load the configuration schema. Compiling the schema is expensive, so it
+    is done only once and reused for all configuration files.
+    """
+    global _SCHEMA
+    if _SCHEMA is None:
+        xmlschema = lxml.etree.fromstring(
+            pkgutil.get_data('lbuild', 'resources/configuration.xsd'))
+        _SCHEMA = lxml.etree.XMLSchema(xmlschema)
+    return _SCHEMA
+
 
 class ConfigNode(anytree.AnyNode):
 
@@ -231,7 +251,7 @@ class ConfigNode(anytree.AnyNode):
                 config._repositories.append(rfilename)
 
         # Load all requested modules
-        config._modules = xmltree.xpath('modules/module/text()')
+        config._modules = _XPATH_MODULES(xmltree)
 
         # Load output path for lbuild and modules
         outpath = xmltree.find("outpath")
@@ -239,14 +259,14 @@ class ConfigNode(anytree.AnyNode):
             config._outpath = ConfigNode._rel_path(outpath.text, configpath)
 
         # Load options
-        for option_node in xmltree.xpath('options/option'):
+        for option_node in _XPATH_OPTIONS(xmltree):
             name = option_node.attrib['name']
             value = option_node.attrib.get('value', option_node.text)
             value = "" if value is None else value
             config._options[name] = (value, filename)
 
         # Load collectors
-        for collector_node in xmltree.xpath('collectors/collect'):
+        for collector_node in _XPATH_COLLECTORS(xmltree):
             name = collector_node.attrib['name']
             value = "" if collector_node.text is None else collector_node.text
             config._collectors.append( (name, value, filename) )
@@ -256,12 +276,19 @@ class ConfigNode(anytree.AnyNode):
     @staticmethod
     def _load_and_verify(configfile):
         try:
-            xmlroot = lxml.etree.parse(str(configfile))
-
-            xmlschema = lxml.etree.fromstring(
-                pkgutil.get_data('lbuild', 'resources/configuration.xsd'))
-            schema = lxml.etree.XMLSchema(xmlschema)
-            schema.assertValid(xmlroot)
+            try:
+                # Validate against the schema while parsing. Parsers must not
+                # be shared between threads, but creating one is cheap.
+                # Whitespace-only text and comments are not needed for
+                # reading the configuration and are dropped from the tree.
+                parser = lxml.etree.XMLParser(schema=_get_schema(), collect_ids=False,
+                                              remove_blank_text=True, remove_comments=True)
+                xmlroot = lxml.etree.parse(str(configfile), parser)
+            except lxml.etree.XMLSyntaxError:
+                # Validating while parsing does not report line numbers, so
+                # validate the file separately to get a useful error message
+                _get_schema().assertValid(lxml.etree.parse(str(configfile)))
+                raise
 
             xmltree = xmlroot.getroot()
         except OSError as error:
@@ -277,8 +304,8 @@ class ConfigNode(anytree.AnyNode):
 
     @staticmethod
     def _substitute_env(configfile, root, env={}):
-        for i, node in enumerate(root):
-
+        # walk all nodes below the root in a single pass
+        for node in root.iterdescendants():
             if node.text and "$" in node.text:
                 # replace all occurences inside the string with lookup matches
                 keys = re.findall(r'\${(.*?)}', node.text)
@@ -289,8 +316,6 @@ class ConfigNode(anytree.AnyNode):
                     else:
                         raise LbuildConfigSubstitutionException(
                                 configfile, lxml.etree.tostring(node).decode("utf-8"), k)
-            # recursively crawl nodes
-            node = ConfigNode._substitute_env(configfile, node, env)
         return root
 
     @staticmethod
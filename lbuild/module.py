@@ -70,7 +70,7 @@ def build_modules(initmodules):
 
     # then connect the entire tree
     for module in modules:
-        parent_name = ":".join(module.fullname.split(":")[:-1])
+        parent_name = module.fullname.rpartition(":")[0]
         parent = rmodules.get(parent_name) if ":" in parent_name else module._repository
         if parent:
             parent.add_child(module)
@@ -197,8 +197,7 @@ class Module(BaseNode):
         for (name, func) in module._filters:
             if not name.startswith("{}.".format(self._repository.name)):
                 nname = "{}.{}".format(self._repository.name, name)
-                LOGGER.warning("Namespacing module filter '{}' to '{}'!"
-                               .format(name, nname))
+                LOGGER.warning("Namespacing module filter '%s' to '%s'!", name, nname)
                 name = nname
             self._filters[name] = func
 
@@ -218,7 +217,7 @@ class Module(BaseNode):
     def validate(self, env):
         validate = self._functions.get("validate", self._functions.get("pre_build", None))
         if validate is not None:
-            LOGGER.info("Validate {}".format(self.fullname))
+            LOGGER.info("Validate %s", self.fullname)
             lbuild.utils.with_forward_exception(self, lambda: validate(env.facade))
 
     def build(self, env):
@@ -228,7 +227,7 @@ class Module(BaseNode):
     def post_build(self, env):
         post_build = self._functions.get("post_build", None)
         if post_build is not None:
-            LOGGER.info("Post-Build {}".format(self.fullname))
+            LOGGER.info("Post-Build %s", self.fullname)
             if len(inspect.signature(post_build).parameters.keys()) == 1:
                 func = lambda: post_build(env.facade)
             else:
@@ -23,6 +23,48 @@ import lbuild.exception as le
 LOGGER = logging.getLogger('lbuild.node')
 
 
+_GLOBALS = None
+
+
+def _module_globals():
+    """
+    Symbols available in every repository and module file. They do not
+    depend on the file, so the namespace is only built once.
+    """
+    global _GLOBALS
+    if _GLOBALS is None:
+        _GLOBALS = {
+            'listify': lu.listify,
+            'listrify': lu.listrify,
+            'uniquify': lu.uniquify,
+
+            'ValidateException': le.LbuildValidateException,
+            'Module': lbuild.module.ModuleBase,
+
+            'Query': lbuild.query.Query,
+            'EnvironmentQuery': lbuild.query.EnvironmentQuery,
+
+            'StringCollector': lbuild.collector.StringCollector,
+            'PathCollector': lbuild.collector.PathCollector,
+            'BooleanCollector': lbuild.collector.BooleanCollector,
+            'NumericCollector': lbuild.collector.NumericCollector,
+            'EnumerationCollector': lbuild.collector.EnumerationCollector,
+            'CallableCollector': lbuild.collector.CallableCollector,
+
+            'StringOption': lbuild.option.StringOption,
+            'PathOption': lbuild.option.PathOption,
+            'BooleanOption': lbuild.option.BooleanOption,
+            'NumericOption': lbuild.option.NumericOption,
+            'EnumerationOption': lbuild.option.EnumerationOption,
+            'SetOption': lbuild.option.SetOption,
+
+            'Configuration': lbuild.repository.Configuration,
+
+            'Alias': Alias,
+        }
+    return _GLOBALS
+
+
 def load_functions_from_file(repository, filename: str, required, optional=None, local=None):
     filename = os.path.realpath(filename)
     localpath = os.path.dirname(filename)
@@ -32,37 +74,11 @@ def load_functions_from_file(repository, filename: str, required, optional=None,
     if local is None:
         local = {}
 
+    local.update(_module_globals())
     local.update({
         'localpath': RelocatePath(localpath),
         'repopath': RelocatePath(repository._filepath),
-        'listify': lu.listify,
-        'listrify': lu.listrify,
-        'uniquify': lu.uniquify,
-
         'FileReader': LocalFileReaderFactory(localpath),
-        'ValidateException': le.LbuildValidateException,
-        'Module': lbuild.module.ModuleBase,
-
-        'Query': lbuild.query.Query,
-        'EnvironmentQuery': lbuild.query.EnvironmentQuery,
-
-        'StringCollector': lbuild.collector.StringCollector,
-        'PathCollector': lbuild.collector.PathCollector,
-        'BooleanCollector': lbuild.collector.BooleanCollector,
-        'NumericCollector': lbuild.collector.NumericCollector,
-        'EnumerationCollector': lbuild.collector.EnumerationCollector,
-        'CallableCollector': lbuild.collector.CallableCollector,
-
-        'StringOption': lbuild.option.StringOption,
-        'PathOption': lbuild.option.PathOption,
-        'BooleanOption': lbuild.option.BooleanOption,
-        'NumericOption': lbuild.option.NumericOption,
-        'EnumerationOption': lbuild.option.EnumerationOption,
-        'SetOption': lbuild.option.SetOption,
-
-        'Configuration': lbuild.repository.Configuration,
-
-        'Alias': Alias,
     })
 
     try:
@@ -75,6 +91,7 @@ def load_functions_from_file(repository, filename: str, required, optional=None,
 
 
 class RelocatePath:
+    __slots__ = ("basepath",)
 
     def __init__(self, basepath):
         self.basepath = basepath
@@ -84,6 +101,7 @@ class RelocatePath:
 
 
 class LocalFileReader:
+    __slots__ = ("basepath", "filename", "_content")
 
     def __init__(self, basepath, filename):
         self.basepath = basepath
@@ -101,6 +119,7 @@ class LocalFileReader:
 
 
 class LocalFileReaderFactory:
+    __slots__ = ("basepath",)
 
     def __init__(self, basepath):
         self.basepath = basepath
@@ -110,6 +129,7 @@ class LocalFileReaderFactory:
 
 
 class NameResolver:
+    __slots__ = ("_node", "_types", "_returner", "_defaulter", "_selected")
 
     def __init__(self, node, nodetypes, selected=True, returner=None, defaulter=None):
         self._node = node
@@ -159,8 +179,8 @@ class NameResolver:
             if node.parent != self._node:
                 if all(n.type not in {BaseNode.Type.PARSER, BaseNode.Type.REPOSITORY} for n in {self._node, node.module}):
                     if node.parent not in self._node.dependencies:
-                        LOGGER.warning("Module '{}' accessing '{}' without depending on '{}'!"
-                                       .format(self._node.fullname, node.fullname, node.module.fullname))
+                        LOGGER.warning("Module '%s' accessing '%s' without depending on '%s'!",
+                                       self._node.fullname, node.fullname, node.module.fullname)
 
         return node
 
@@ -399,8 +419,9 @@ class BaseNode(anytree.Node):
             return
 
         dependencies = set()
+        resolver = self.module_resolver
         for dependency_name in {n for n in self._dependency_module_names if ":" in n}:
-            dependency = self.module_resolver[dependency_name]
+            dependency = resolver[dependency_name]
             dependencies.add(dependency)
 
         self._dependencies = list(dependencies)
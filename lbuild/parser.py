@@ -146,19 +146,7 @@ class Parser(BaseNode):
 
     def merge_repository_options(self):
         # only deal with repo options that contain one `:`
-        resolver = self.option_resolver
-        # print(self.config.options.items())
-        for name, (value, filename) in filter(lambda i: i[0].count(":") == 1,
-                                              self.config.options.items()):
-            try:
-                option = resolver[name]
-                option._filename = filename
-                option.value = value
-            except le.LbuildOptionException as error:
-                raise le.LbuildParserOptionInvalidException(self, error, filename)
-            except le.LbuildResolverNoMatchException as error:
-                raise le.LbuildParserNodeNotFoundException(self, name, self.Type.OPTION, filename)
-
+        self._merge_options(lambda colons: colons == 1, self.repo_options)
 
     def prepare_repositories(self):
         undefined = self._undefined_repo_options()
@@ -181,12 +169,20 @@ class Parser(BaseNode):
         return modules
 
     def merge_module_options(self):
-        # only deal with repo options that contain one `:`
+        # only deal with module options that contain more than one `:`
+        self._merge_options(lambda colons: colons > 1, self.module_options)
+
+    def _merge_options(self, select, options):
         resolver = self.option_resolver
-        for name, (value, filename) in filter(lambda i: i[0].count(":") > 1,
-                                              self.config.options.items()):
+        for name, (value, filename) in self.config.options.items():
+            if not select(name.count(":")):
+                continue
             try:
-                option = resolver[name]
+                # Fully qualified names are looked up directly, partial names
+                # still need to be resolved through the tree
+                option = options.get(name)
+                if option is None:
+                    option = resolver[name]
                 option._filename = filename
                 option.value = value
             except le.LbuildOptionException as error:
@@ -207,27 +203,24 @@ class Parser(BaseNode):
         Returns:
             list: Required modules for the given list of modules.
         """
-        selected_modules = set(requested_modules.copy())
+        selected_modules = set(requested_modules)
         LOGGER.info("Selected modules: %s",
                     ", ".join(sorted(module.fullname for module in selected_modules)))
 
         self._update_dependencies()
         try:
-            current = selected_modules
-            while depth > 0:
-                additional = set()
-                for module in current:
-                    for dependency in module.dependencies:
-                        if dependency not in selected_modules and dependency not in additional:
-                            LOGGER.debug("Adding dependency: %s", dependency.fullname)
-                            additional.add(dependency)
-                if not additional:
-                    # Abort if no new dependencies are being found
-                    break
-                selected_modules.update(additional)
-                current = additional
-                additional = []
-                depth -= 1
+            # Walk breadth-first so that every module is reached at its
+            # minimal depth. Each module is visited exactly once.
+            pending = collections.deque((module, depth) for module in selected_modules)
+            while pending:
+                module, remaining = pending.popleft()
+                if remaining <= 0:
+                    continue
+                for dependency in module.dependencies:
+                    if dependency not in selected_modules:
+                        LOGGER.debug("Adding dependency: %s", dependency.fullname)
+                        selected_modules.add(dependency)
+                        pending.append((dependency, remaining - 1))
 
         except (le.LbuildResolverNoMatchException,
                 le.LbuildResolverAmbiguousMatchException) as error:
@@ -96,6 +96,7 @@ class Repository(BaseNode):
         self._format_description = repo._format_description
         self._format_short_description = repo._format_short_description
         self._build_order = sys.maxsize
+        self._option_value_resolver = None
 
         if repo.name is None:
             raise le.LbuildRepositoryNoNameException(repo._parser, repo)
@@ -105,8 +106,7 @@ class Repository(BaseNode):
         for (name, func) in repo._filters:
             if not name.startswith("{}.".format(self.name)):
                 nname = "{}.{}".format(self.name, name)
-                LOGGER.warning("Namespacing repository filter '{}' to '{}'!"
-                               .format(name, nname))
+                LOGGER.warning("Namespacing repository filter '%s' to '%s'!", name, nname)
                 name = nname
             self._filters[name] = func
 
@@ -135,6 +135,14 @@ class Repository(BaseNode):
     def modules(self):
         return {m.fullname:m for m in self.all_modules()}
 
+    @property
+    def option_value_resolver(self):
+        # The resolver looks up the options on every access, so one instance
+        # can be shared by all modules of this repository
+        if self._option_value_resolver is None:
+            self._option_value_resolver = super().option_value_resolver
+        return self._option_value_resolver
+
     def prepare(self):
         lbuild.utils.with_forward_exception(
             self,
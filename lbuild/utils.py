@@ -14,6 +14,7 @@ import sys
 import uuid
 import shutil
 import fnmatch
+import functools
 import importlib.util
 import importlib.machinery
 
@@ -129,6 +130,23 @@ def get_global_functions(env, required, optional=None):
     return functions
 
 
+@functools.lru_cache(maxsize=1024)
+def _compile_cached(filename, mtime, size):
+    """
+    Compile a python source file once per process.
+
+    The modification time and size of the file are part of the cache key, so
+    that changed files are compiled again.
+    """
+    loader = importlib.machinery.SourceFileLoader("lbuild.modules.code", filename)
+    return loader.get_code(loader.name)
+
+
+def _load_code(filename):
+    stat = os.stat(filename)
+    return _compile_cached(filename, stat.st_mtime_ns, stat.st_size)
+
+
 def load_module_from_file(filename, local, modulename=None):
     """
     Load a python module from a local file.
@@ -162,7 +180,11 @@ def load_module_from_file(filename, local, modulename=None):
 
     try:
         # Load the module. This executes the code inside the lbuild module file.
-        loader.exec_module(module)
+        # The loader caches the compiled code object in `__pycache__` next to
+        # the module file, keyed by the source mtime and size, so unchanged
+        # files are not recompiled on the next run. Within one process the
+        # code object is reused directly.
+        exec(_load_code(filename), module.__dict__)
     except Exception as error:
         raise le.LbuildForwardException(modulename, error)
 
@@ -47,6 +47,26 @@ class DepedencyTest(unittest.TestCase):
         with self.assertRaises(le.LbuildParserCannotResolveDependencyException):
             self.parser.resolve_dependencies([module])
 
+    def _resolve_with_depth(self, depth):
+        # module1 -> module2 -> module3 -> module4 and module1 -> module3
+        self.parser.parse_repository(self._get_path("depth/repo.lb"))
+        self.parser.prepare_repositories()
+
+        module = self.parser.find_module(":module1")
+        return sorted(m.name for m in self.parser.resolve_dependencies([module], depth))
+
+    def test_should_not_resolve_dependencies_with_depth_0(self):
+        self.assertEqual(["module1"], self._resolve_with_depth(0))
+
+    def test_should_resolve_dependencies_with_depth_1(self):
+        self.assertEqual(["module1", "module2", "module3"], self._resolve_with_depth(1))
+
+    def test_should_resolve_dependencies_with_minimal_depth(self):
+        # module3 is also reached through module2, but its dependency module4
+        # is only two steps away through the direct edge module1 -> module3
+        self.assertEqual(["module1", "module2", "module3", "module4"],
+                         self._resolve_with_depth(2))
+
     def test_should_update_option_dependencies(self):
         self.parser.parse_repository(self._get_path("option_dependency/repo.lb"))
         self.parser.prepare_repositories()
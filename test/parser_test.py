@@ -63,6 +63,15 @@ class ParserTest(unittest.TestCase):
         self.parser.parse_repository(self._get_path("combined/repo1.lb"))
         self.assertEqual(1, len(self.parser.repositories))
 
+    def test_should_reuse_compiled_repository_code(self):
+        lbuild.utils._compile_cached.cache_clear()
+        self.parser.parse_repository(self._get_path("combined/repo1.lb"))
+        lbuild.parser.Parser().parse_repository(self._get_path("combined/repo1.lb"))
+
+        info = lbuild.utils._compile_cached.cache_info()
+        self.assertEqual(1, info.misses)
+        self.assertEqual(1, info.hits)
+
     def test_should_find_files_in_repository_1(self):
         repo = self.parser.parse_repository(self._get_path("combined/repo1.lb"))
         self.parser.merge_repository_options()